@@ -8,6 +8,9 @@ from typing import Set, Optional, Dict, List, Tuple
 import pandas as pd
 import re
 import os
+import time
+import multiprocessing
+import multiprocessing.connection
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -263,6 +266,7 @@ class CombinedKGProcessor:
     def setup_pca_settings(self, config: dict):
         """Setup PCA-specific settings from config"""
         settings = config.get('pca_settings', {})
+        self.pca_settings = settings
 
         # Setup custom namespaces for PCA
         self.pca_namespaces = {}
@@ -277,6 +281,49 @@ class CombinedKGProcessor:
         self.valid_values = settings.get('valid_values', ['valid'])
         self.invalid_values = settings.get('invalid_values', ['invalid'])
 
+        # Scheduling settings
+        self.workers = settings.get('workers', 1)
+        self.rule_time_budget = settings.get('rule_time_budget')
+        # Rules at or below this estimated cost run first. When unset, the threshold is the
+        # cheap_rule_percentile of the estimated costs, so a fixed share of the rules (half
+        # by default) is ordered longest-first whatever the scale of the KG.
+        self.cheap_rule_cost = settings.get('cheap_rule_cost')
+        self.cheap_rule_percentile = settings.get('cheap_rule_percentile', 50)
+
+        if not isinstance(self.workers, int) or self.workers < 1:
+            raise ValueError(f"workers must be a positive integer, got {self.workers!r}")
+        if self.rule_time_budget is not None and (not isinstance(self.rule_time_budget, (int, float))
+                                                  or self.rule_time_budget <= 0):
+            raise ValueError(f"rule_time_budget must be a positive number of seconds or null, "
+                             f"got {self.rule_time_budget!r}")
+        if self.workers > (os.cpu_count() or 1):
+            logger.warning(f"workers={self.workers} exceeds the {os.cpu_count()} available CPUs")
+        if not 0 <= self.cheap_rule_percentile <= 100:
+            raise ValueError(f"cheap_rule_percentile must be between 0 and 100, "
+                             f"got {self.cheap_rule_percentile!r}")
+
+    def setup_mining_settings(self, config: dict):
+        """Setup rule mining settings from config"""
+        settings = config.get('mining_settings', {})
+
+        self.mining_enabled = settings.get('enabled', False)
+        self.max_body_length = settings.get('max_body_length', 2)
+        self.min_support = settings.get('min_support', 1)
+        self.min_head_coverage = settings.get('min_head_coverage', 0.01)
+        # PCA thresholds left unset (None) are inactive; every threshold that is set must hold
+        self.min_pca_valid = settings.get('min_pca_valid')
+        self.min_pca_invalid = settings.get('min_pca_invalid')
+
+        if not isinstance(self.max_body_length, int) or self.max_body_length < 1:
+            raise ValueError(f"max_body_length must be a positive integer, got {self.max_body_length!r}")
+        if not isinstance(self.min_support, int) or self.min_support < 1:
+            raise ValueError(f"min_support must be a positive integer, got {self.min_support!r}")
+        if not isinstance(self.min_head_coverage, (int, float)) or not 0 <= self.min_head_coverage <= 1:
+            raise ValueError(f"min_head_coverage must be between 0 and 1, got {self.min_head_coverage!r}")
+        for name, min_pca in [('min_pca_valid', self.min_pca_valid), ('min_pca_invalid', self.min_pca_invalid)]:
+            if min_pca is not None and (not isinstance(min_pca, (int, float)) or not 0 <= min_pca <= 1):
+                raise ValueError(f"{name} must be between 0 and 1 or null, got {min_pca!r}")
+
     def parse_rule_components(self, body: str, head: str) -> Dict:
         """Parse rule body and head into components"""
         body_patterns = self._extract_triple_patterns(body)
@@ -463,6 +510,219 @@ WHERE {{
 
         return f"{s} {p_formatted} {placeholder} ."
 
+    def _execute_rule_query(self, body: str, head: str) -> Optional[Tuple[int, int, int, int]]:
+        """Run the combined PCA query for one rule and return its four raw counts"""
+        rule_components = self.parse_rule_components(body, head)
+        query = self.create_combined_pca_query(rule_components)
+
+        # Execute query
+        results = list(self.kg_graph.query(query))
+
+        if results and len(results[0]) == 4:
+            return tuple(int(value) if value else 0 for value in results[0])
+        return None
+
+    def estimate_rule_cost(self, kg_index: Dict, body: str, head: str) -> float:
+        """
+        Estimate the cost of a rule's PCA query from index cardinalities.
+
+        The body is assumed to be evaluated from its most selective pattern, joined
+        against the remaining patterns and the head, and the PCA subqueries fan out
+        over the average number of head-predicate values per subject.
+
+        Args:
+            kg_index (Dict): Index built by build_kg_index
+            body (str): Rule body
+            head (str): Rule head
+
+        Returns:
+            float: Estimated number of bindings visited by the four subqueries
+        """
+        rule_components = self.parse_rule_components(body, head)
+        body_patterns = rule_components['body_patterns']
+        head_pattern = rule_components['head_pattern']
+
+        def pattern_cardinality(pattern: Tuple[str, str, str]) -> int:
+            _, p, o = pattern
+            if o.startswith('?'):
+                return kg_index['predicate_sizes'].get(p, 0)
+            return len(kg_index['atom_subjects'].get((p, o), ()))
+
+        if body_patterns:
+            body_cardinality = min(pattern_cardinality(pattern) for pattern in body_patterns)
+        else:
+            body_cardinality = len(kg_index['valid_entities']) + len(kg_index['invalid_entities'])
+
+        fan_out = 1.0
+        if head_pattern and kg_index['predicate_subjects'].get(head_pattern[1]):
+            fan_out = max(1.0, kg_index['predicate_sizes'][head_pattern[1]] /
+                          len(kg_index['predicate_subjects'][head_pattern[1]]))
+
+        return 4 * body_cardinality * (len(body_patterns) + 1) * fan_out
+
+    def schedule_rules(self, costs: pd.Series) -> List:
+        """
+        Order rules for execution: cheap rules first, then expensive rules longest-first.
+
+        Running the longest expensive rules first lets workers that pick up the
+        remaining ones finish at about the same time.
+
+        Args:
+            costs (pd.Series): Estimated cost per rule, indexed like the rules DataFrame
+
+        Returns:
+            List: Rule indices in execution order
+        """
+        threshold = self.cheap_rule_cost
+        if threshold is None:
+            threshold = costs.quantile(self.cheap_rule_percentile / 100) if len(costs) else 0.0
+
+        cheap = costs[costs <= threshold].sort_values(kind='stable')
+        expensive = costs[costs > threshold].sort_values(ascending=False, kind='stable')
+
+        logger.info(f"Scheduled {len(cheap)} cheap rules (estimated cost <= {threshold:.0f}) "
+                    f"before {len(expensive)} expensive rules")
+        return list(cheap.index) + list(expensive.index)
+
+    def _store_rule_counts(self, df: pd.DataFrame, idx, counts: Tuple[int, int, int, int]):
+        """Store raw counts for a rule and derive its PCA scores"""
+        support_valid, support_invalid, pca_body_valid, pca_body_invalid = counts
+
+        # Store raw counts
+        df.at[idx, 'Support_valid'] = support_valid
+        df.at[idx, 'Support_invalid'] = support_invalid
+        df.at[idx, 'PCABody_valid'] = pca_body_valid
+        df.at[idx, 'PCABody_invalid'] = pca_body_invalid
+
+        # Calculate individual PCA scores
+        if pca_body_valid > 0:
+            df.at[idx, 'PCA_valid'] = support_valid / pca_body_valid
+        if pca_body_invalid > 0:
+            df.at[idx, 'PCA_invalid'] = support_invalid / pca_body_invalid
+
+        # Calculate proportions based on support
+        total_support = support_valid + support_invalid
+        if total_support > 0:
+            # These are complementary and sum to 1
+            df.at[idx, 'PCA_valid_proportion'] = support_valid / total_support
+            df.at[idx, 'PCA_invalid_proportion'] = support_invalid / total_support
+
+    def _record_rule_result(self, df: pd.DataFrame, idx, status: str, result):
+        """Record the outcome of one rule: counts on success, a message otherwise"""
+        df.at[idx, 'Status'] = status
+
+        if status == 'ok':
+            if result is not None:
+                self._store_rule_counts(df, idx, result)
+
+            # Debug first rule
+            if idx == 0:
+                print(f"\nFirst rule: {df.at[idx, 'Body']} => {df.at[idx, 'Head']}")
+                print(f"Support: valid={df.at[idx, 'Support_valid']}, invalid={df.at[idx, 'Support_invalid']}")
+                print(f"PCABody: valid={df.at[idx, 'PCABody_valid']}, invalid={df.at[idx, 'PCABody_invalid']}")
+                print(f"PCA: valid={df.at[idx, 'PCA_valid']:.4f}, invalid={df.at[idx, 'PCA_invalid']:.4f}")
+                print(
+                    f"PCA proportions: valid={df.at[idx, 'PCA_valid_proportion']:.4f}, invalid={df.at[idx, 'PCA_invalid_proportion']:.4f}")
+        elif status == 'timeout':
+            print(f"Timeout processing rule {idx}: exceeded {self.rule_time_budget}s budget")
+        else:
+            print(f"Error processing rule {idx}: {result}")
+
+    def _run_rules_in_workers(self, df: pd.DataFrame, order: List, extended_kg_path: str):
+        """
+        Execute rules in worker processes, cancelling any rule that exceeds its time budget.
+
+        Each worker evaluates one rule at a time. A worker whose rule runs past
+        rule_time_budget is terminated, the rule is marked as timeout and a fresh
+        worker takes its place.
+        """
+        if 'fork' in multiprocessing.get_all_start_methods():
+            # Workers inherit the loaded KG instead of reparsing it
+            context = multiprocessing.get_context('fork')
+            worker_args = (self, None, None)
+        else:
+            # Without fork (Windows) each worker loads the extended KG itself
+            context = multiprocessing.get_context('spawn')
+            worker_args = (None, self.pca_settings, extended_kg_path)
+
+        pending = list(reversed(order))
+        workers = []
+        completed = 0
+
+        def start_worker() -> Dict:
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(target=_pca_rule_worker, args=worker_args + (child_conn,), daemon=True)
+            process.start()
+            child_conn.close()
+
+            # Wait until the worker has its KG so loading does not count against the budget
+            try:
+                parent_conn.recv()
+            except EOFError:
+                process.join()
+                raise RuntimeError(f"PCA worker failed to start (exit code {process.exitcode})")
+            return {'process': process, 'conn': parent_conn, 'task': None, 'started': None}
+
+        def finish(worker: Dict, status: str, result):
+            nonlocal completed
+            self._record_rule_result(df, worker['task'], status, result)
+            worker['task'] = None
+            completed += 1
+            if completed % 100 == 0:
+                print(f"Processed rule {completed}/{len(order)}")
+
+        def replace(worker: Dict):
+            worker['process'].terminate()
+            worker['process'].join()
+            worker['conn'].close()
+            workers[workers.index(worker)] = start_worker()
+
+        try:
+            for _ in range(min(self.workers, len(order))):
+                workers.append(start_worker())
+
+            while pending or any(worker['task'] is not None for worker in workers):
+                # Hand the next rule to every idle worker
+                for worker in workers:
+                    if worker['task'] is None and pending:
+                        idx = pending.pop()
+                        worker['task'] = idx
+                        worker['started'] = time.monotonic()
+                        worker['conn'].send((idx, df.at[idx, 'Body'], df.at[idx, 'Head']))
+
+                busy = [worker for worker in workers if worker['task'] is not None]
+                timeout = None
+                if self.rule_time_budget is not None:
+                    timeout = max(0.0, min(worker['started'] + self.rule_time_budget for worker in busy)
+                                  - time.monotonic())
+
+                ready = multiprocessing.connection.wait([worker['conn'] for worker in busy], timeout)
+                for worker in busy:
+                    if worker['conn'] in ready:
+                        try:
+                            _, status, result = worker['conn'].recv()
+                        except EOFError:
+                            finish(worker, 'error', 'worker process exited unexpectedly')
+                            replace(worker)
+                            continue
+                        finish(worker, status, result)
+                    elif (self.rule_time_budget is not None
+                          and time.monotonic() - worker['started'] >= self.rule_time_budget):
+                        finish(worker, 'timeout', None)
+                        replace(worker)
+        finally:
+            for worker in workers:
+                if worker['process'].is_alive():
+                    try:
+                        worker['conn'].send(None)
+                    except (BrokenPipeError, OSError):
+                        pass
+                worker['process'].join(timeout=1)
+                if worker['process'].is_alive():
+                    worker['process'].terminate()
+                    worker['process'].join()
+                worker['conn'].close()
+
     def calculate_pca_scores(self, rules_csv_path: str, extended_kg_path: str) -> pd.DataFrame:
         """Calculate complementary PCA confidence scores for all rules"""
         # Load the extended KG with validation status
@@ -480,62 +740,209 @@ WHERE {{
         df['Support_invalid'] = 0
         df['PCABody_valid'] = 0
         df['PCABody_invalid'] = 0
+        df['Status'] = 'pending'
+
+        # Estimate rule costs from the index so the schedule is known before any query runs
+        kg_index = self.build_kg_index(self.kg_graph)
+        costs = {}
+        for idx, row in df.iterrows():
+            try:
+                costs[idx] = self.estimate_rule_cost(kg_index, row['Body'], row['Head'])
+            except Exception as e:
+                # Rules that cannot be parsed are never scheduled
+                self._record_rule_result(df, idx, 'error', e)
+        order = self.schedule_rules(pd.Series(costs, dtype=float))
 
         print(f"\nProcessing {len(df)} rules...")
         print(f"Calculating complementary PCA scores...")
 
-        for idx, row in df.iterrows():
-            if idx % 100 == 0:
-                print(f"Processing rule {idx + 1}/{len(df)}")
+        if self.workers > 1 or self.rule_time_budget is not None:
+            self._run_rules_in_workers(df, order, extended_kg_path)
+        else:
+            for position, idx in enumerate(order):
+                if position % 100 == 0:
+                    print(f"Processing rule {position + 1}/{len(order)}")
 
-            body = row['Body']
-            head = row['Head']
+                try:
+                    counts = self._execute_rule_query(df.at[idx, 'Body'], df.at[idx, 'Head'])
+                    self._record_rule_result(df, idx, 'ok', counts)
+                except Exception as e:
+                    self._record_rule_result(df, idx, 'error', e)
 
-            try:
-                rule_components = self.parse_rule_components(body, head)
-                query = self.create_combined_pca_query(rule_components)
-
-                # Execute query
-                results = list(self.kg_graph.query(query))
-
-                if results and len(results[0]) == 4:
-                    support_valid = int(results[0][0]) if results[0][0] else 0
-                    support_invalid = int(results[0][1]) if results[0][1] else 0
-                    pca_body_valid = int(results[0][2]) if results[0][2] else 0
-                    pca_body_invalid = int(results[0][3]) if results[0][3] else 0
-
-                    # Store raw counts
-                    df.at[idx, 'Support_valid'] = support_valid
-                    df.at[idx, 'Support_invalid'] = support_invalid
-                    df.at[idx, 'PCABody_valid'] = pca_body_valid
-                    df.at[idx, 'PCABody_invalid'] = pca_body_invalid
-
-                    # Calculate individual PCA scores
-                    if pca_body_valid > 0:
-                        df.at[idx, 'PCA_valid'] = support_valid / pca_body_valid
-                    if pca_body_invalid > 0:
-                        df.at[idx, 'PCA_invalid'] = support_invalid / pca_body_invalid
-
-                    # Calculate proportions based on support
-                    total_support = support_valid + support_invalid
-                    if total_support > 0:
-                        # These are complementary and sum to 1
-                        df.at[idx, 'PCA_valid_proportion'] = support_valid / total_support
-                        df.at[idx, 'PCA_invalid_proportion'] = support_invalid / total_support
-
-                # Debug first rule
-                if idx == 0:
-                    print(f"\nFirst rule: {body} => {head}")
-                    print(f"Support: valid={support_valid}, invalid={support_invalid}")
-                    print(f"PCABody: valid={pca_body_valid}, invalid={pca_body_invalid}")
-                    print(f"PCA: valid={df.at[idx, 'PCA_valid']:.4f}, invalid={df.at[idx, 'PCA_invalid']:.4f}")
-                    print(
-                        f"PCA proportions: valid={df.at[idx, 'PCA_valid_proportion']:.4f}, invalid={df.at[idx, 'PCA_invalid_proportion']:.4f}")
+        print("\nPCA confidence calculation completed!")
+        return df
 
-            except Exception as e:
-                print(f"Error processing rule {idx}: {e}")
+    # Rule miner methods start here
+    def build_kg_index(self, kg_graph: Graph) -> Dict:
+        """
+        Index the extended KG by (predicate, object) atoms and validation status.
 
-        print("\nPCA confidence calculation completed!")
+        Only predicates in the default namespace are indexed, keyed by their local
+        names as they appear in the rules; atoms additionally need an object in the
+        default namespace. Like the SPARQL patterns built by _create_sparql_patterns,
+        this leaves out predicates such as rdf:type, so rules over them are not mined.
+
+        Args:
+            kg_graph (Graph): The extended knowledge graph with validation status
+
+        Returns:
+            Dict: Subject sets per atom and per predicate, triple counts per
+                predicate, plus valid/invalid entities
+        """
+        default_ns = str(self.default_ns)
+        validation_predicate = URIRef(self.validation_predicate)
+        # Match statuses exactly as create_combined_pca_query does
+        valid_status = Literal(self.valid_values[0], datatype=XSD.string)
+        invalid_status = Literal(self.invalid_values[0], datatype=XSD.string)
+
+        atom_subjects = {}
+        predicate_subjects = {}
+        predicate_sizes = {}
+        valid_entities = set()
+        invalid_entities = set()
+
+        for s, p, o in kg_graph:
+            if p == validation_predicate:
+                if o == valid_status:
+                    valid_entities.add(str(s))
+                elif o == invalid_status:
+                    invalid_entities.add(str(s))
+                continue
+
+            if not str(p).startswith(default_ns):
+                continue
+
+            # The PCA head pattern ?a p ?X1 matches any object, so every subject counts here
+            predicate = str(p)[len(default_ns):]
+            predicate_subjects.setdefault(predicate, set()).add(str(s))
+            predicate_sizes[predicate] = predicate_sizes.get(predicate, 0) + 1
+
+            if not isinstance(o, URIRef) or not str(o).startswith(default_ns):
+                continue
+
+            obj = str(o)[len(default_ns):]
+            atom_subjects.setdefault((predicate, obj), set()).add(str(s))
+
+        logger.info(f"Indexed {len(atom_subjects)} atoms over {len(predicate_subjects)} predicates")
+        return {
+            'atom_subjects': atom_subjects,
+            'predicate_subjects': predicate_subjects,
+            'predicate_sizes': predicate_sizes,
+            'valid_entities': valid_entities,
+            'invalid_entities': invalid_entities
+        }
+
+    def _score_mined_rule(self, kg_index: Dict, body_subjects: Set[str], head: Tuple[str, str]) -> Dict:
+        """Compute AMIE-style and complementary PCA measures for a candidate rule"""
+        head_subjects = kg_index['atom_subjects'][head]
+        pca_subjects = body_subjects & kg_index['predicate_subjects'][head[0]]
+        support_subjects = body_subjects & head_subjects
+
+        support = len(support_subjects)
+        support_valid = len(support_subjects & kg_index['valid_entities'])
+        support_invalid = len(support_subjects & kg_index['invalid_entities'])
+        pca_body_valid = len(pca_subjects & kg_index['valid_entities'])
+        pca_body_invalid = len(pca_subjects & kg_index['invalid_entities'])
+        total_support = support_valid + support_invalid
+
+        return {
+            # AMIE head coverage: support over the number of head relation facts
+            'Head Coverage': support / kg_index['predicate_sizes'][head[0]],
+            'Standard Confidence': support / len(body_subjects) if body_subjects else 0.0,
+            'Pca Confidence': support / len(pca_subjects) if pca_subjects else 0.0,
+            'Support': support,
+            'Body Size': len(body_subjects),
+            'Pca Body Size': len(pca_subjects),
+            'PCA_valid': support_valid / pca_body_valid if pca_body_valid > 0 else 0.0,
+            'PCA_invalid': support_invalid / pca_body_invalid if pca_body_invalid > 0 else 0.0,
+            'PCA_valid_proportion': support_valid / total_support if total_support > 0 else 0.0,
+            'PCA_invalid_proportion': support_invalid / total_support if total_support > 0 else 0.0,
+            'Support_valid': support_valid,
+            'Support_invalid': support_invalid,
+            'PCABody_valid': pca_body_valid,
+            'PCABody_invalid': pca_body_invalid
+        }
+
+    def _format_mined_rule(self, body: List[Tuple[str, str]], head: Tuple[str, str]) -> Tuple[str, str]:
+        """Render body and head atoms in the whitespace layout of the AMIE rules files"""
+        body_str = '  '.join(f"?a  {p}  {o}" for p, o in body) + '   '
+        head_str = f"?a  {head[0]}  {head[1]}"
+        return body_str, head_str
+
+    def mine_pca_rules(self, extended_kg_path: str) -> pd.DataFrame:
+        """
+        Mine ?a p O => ?a p' O' rules over the indexed KG and score them while mining.
+
+        Bodies are grown atom by atom up to max_body_length. Support only shrinks
+        as a body grows, so a rule is not refined once it falls below min_support
+        or min_head_coverage. A rule is emitted only if it meets every PCA
+        threshold that is set. PCA is not anti-monotone: a refinement can raise it
+        to 1 as long as the partition keeps any support. The only sound PCA bound
+        is therefore that a partition with a positive threshold and no support is
+        never refined further.
+
+        Args:
+            extended_kg_path (str): Path to the KG extended with validation status
+
+        Returns:
+            pd.DataFrame: Mined rules with the columns produced by calculate_pca_scores
+        """
+        self.kg_graph = self.load_kg(extended_kg_path)
+        kg_index = self.build_kg_index(self.kg_graph)
+        atom_subjects = kg_index['atom_subjects']
+
+        thresholds = [(min_pca, support_col, pca_col) for min_pca, support_col, pca_col in
+                      [(self.min_pca_valid, 'Support_valid', 'PCA_valid'),
+                       (self.min_pca_invalid, 'Support_invalid', 'PCA_invalid')]
+                      if min_pca is not None]
+
+        rows = []
+        heads = sorted(atom_subjects)
+
+        print(f"\nMining rules for {len(heads)} head atoms...")
+
+        for head_idx, head in enumerate(heads):
+            if head_idx % 100 == 0:
+                print(f"Processing head {head_idx + 1}/{len(heads)}")
+
+            head_subjects = atom_subjects[head]
+            head_relation_size = kg_index['predicate_sizes'][head[0]]
+            min_head_support = max(self.min_support, self.min_head_coverage * head_relation_size)
+
+            # Single-atom bodies that already miss the head thresholds can never be extended
+            candidates = [atom for atom in heads
+                          if atom != head and len(atom_subjects[atom] & head_subjects) >= min_head_support]
+
+            stack = [([i], atom_subjects[atom]) for i, atom in reversed(list(enumerate(candidates)))]
+            while stack:
+                body_idx, body_subjects = stack.pop()
+                if len(body_subjects & head_subjects) < min_head_support:
+                    continue
+
+                scores = self._score_mined_rule(kg_index, body_subjects, head)
+                # Partition support only shrinks, so its PCA can never become positive again
+                if any(min_pca > 0 and scores[support_col] == 0 for min_pca, support_col, _ in thresholds):
+                    continue
+
+                if all(scores[pca_col] >= min_pca for min_pca, _, pca_col in thresholds):
+                    body_str, head_str = self._format_mined_rule([candidates[i] for i in body_idx], head)
+                    rows.append({'Body': body_str, 'Head': head_str, **scores, 'Functional Variable': '?a',
+                                 'Status': 'ok'})
+
+                if len(body_idx) < self.max_body_length:
+                    for i in range(len(candidates) - 1, body_idx[-1], -1):
+                        refined_subjects = body_subjects & atom_subjects[candidates[i]]
+                        # Skip atoms that do not restrict the body; they only duplicate the parent rule
+                        if len(refined_subjects) < len(body_subjects):
+                            stack.append((body_idx + [i], refined_subjects))
+
+        columns = ['Body', 'Head', 'Head Coverage', 'Standard Confidence', 'Pca Confidence', 'Support',
+                   'Body Size', 'Pca Body Size', 'Functional Variable',
+                   'PCA_valid', 'PCA_invalid', 'PCA_valid_proportion', 'PCA_invalid_proportion',
+                   'Support_valid', 'Support_invalid', 'PCABody_valid', 'PCABody_invalid', 'Status']
+        df = pd.DataFrame(rows, columns=columns)
+
+        print(f"\nRule mining completed: {len(df)} rules")
         return df
 
     def process_complete_pipeline(self, config_path: str) -> str:
@@ -614,18 +1021,24 @@ WHERE {{
             # STEP 2: Setup PCA calculation
             self.setup_pca_settings(config)
 
+            self.setup_mining_settings(config)
+
             # Get PCA-specific paths
             rules_csv_path = input_config.get('rules_path')
-            if not rules_csv_path:
-                raise ValueError("rules_path must be specified in config file")
+            if not rules_csv_path and not self.mining_enabled:
+                raise ValueError("rules_path must be specified in config file unless mining is enabled")
 
             # Create PCA output path
             pca_output_filename = f"{kg_name}_constraint-pca_results.csv"
             pca_output_path = output_folder_path / pca_output_filename
 
-            # STEP 3: Calculate PCA scores
-            logger.info("Starting PCA calculation...")
-            df_results = self.calculate_pca_scores(rules_csv_path, str(extended_kg_path))
+            # STEP 3: Calculate PCA scores, either while mining or for the given rules
+            if self.mining_enabled:
+                logger.info("Starting rule mining with PCA calculation...")
+                df_results = self.mine_pca_rules(str(extended_kg_path))
+            else:
+                logger.info("Starting PCA calculation...")
+                df_results = self.calculate_pca_scores(rules_csv_path, str(extended_kg_path))
 
             # Save PCA results
             df_results.to_csv(pca_output_path, index=False)
@@ -663,9 +1076,34 @@ WHERE {{
         print(f"  Average PCA_invalid: {df_results['PCA_invalid'].mean():.4f}")
         print(f"  Rules with PCA_valid > 0: {(df_results['PCA_valid'] > 0).sum()}")
         print(f"  Rules with PCA_invalid > 0: {(df_results['PCA_invalid'] > 0).sum()}")
+
+        print(f"\nRule status:")
+        for status, count in df_results['Status'].value_counts().items():
+            print(f"  {status}: {count}")
         print("=" * 60)
 
 
+def _pca_rule_worker(processor: Optional[CombinedKGProcessor], pca_settings: Optional[dict],
+                     extended_kg_path: Optional[str], conn):
+    """Worker loop: evaluate rules sent over the pipe until None is received"""
+    if processor is None:
+        processor = CombinedKGProcessor()
+        processor.setup_pca_settings({'pca_settings': pca_settings})
+        processor.kg_graph = processor.load_kg(extended_kg_path)
+    conn.send('ready')
+
+    while True:
+        task = conn.recv()
+        if task is None:
+            break
+
+        idx, body, head = task
+        try:
+            conn.send((idx, 'ok', processor._execute_rule_query(body, head)))
+        except Exception as e:
+            conn.send((idx, 'error', str(e)))
+
+
 def main():
     """Main function to run the combined pipeline"""
     if len(sys.argv) != 2: